@@ -2,6 +2,8 @@
 Core data model and analysis functions for spicy chicken shop sales.
 
 - Defines the SaleRecord dataclass and CSV loader.
+- Stores money as integer cents so aggregates are exact; dollars are only
+  produced at output.
 - Provides aggregation and grouping functions over sales records.
 - Uses a functional, stream-style approach (iterables, lambdas, map, sorted).
 """
@@ -9,6 +11,7 @@ Core data model and analysis functions for spicy chicken shop sales.
 from __future__ import annotations
 
 import csv
+import re
 from collections import defaultdict
 from dataclasses import dataclass
 from datetime import datetime
@@ -26,14 +29,29 @@ class SaleRecord:
     item: str
     category: str
     quantity: int
-    unit_price: float
+    unit_price_cents: int
     payment_method: str
-    order_total: float
+    order_total_cents: int
+
+    @property
+    def unit_price(self) -> float:
+        """Unit price in dollars."""
+        return cents_to_dollars(self.unit_price_cents)
+
+    @property
+    def order_total(self) -> float:
+        """Order total in dollars."""
+        return cents_to_dollars(self.order_total_cents)
+
+    @property
+    def line_revenue_cents(self) -> int:
+        """Revenue for this line in cents (quantity * unit price)."""
+        return self.quantity * self.unit_price_cents
 
     @property
     def line_revenue(self) -> float:
-        """Revenue for this line (quantity * unit price)."""
-        return self.quantity * self.unit_price
+        """Revenue for this line in dollars (quantity * unit price)."""
+        return cents_to_dollars(self.line_revenue_cents)
 
 
 def parse_order_datetime(value: str) -> datetime:
@@ -41,6 +59,30 @@ def parse_order_datetime(value: str) -> datetime:
     return datetime.strptime(value, "%Y-%m-%d %H:%M")
 
 
+# Optional sign, ASCII digits, at most two decimal places, at least one digit
+_MONEY_PATTERN = re.compile(r"([+-]?)(?=\.?[0-9])([0-9]*)(?:\.([0-9]{0,2}))?")
+
+
+def parse_cents(value: str) -> int:
+    """
+    Parse a decimal money string such as '12.50' into integer cents.
+
+    The string is parsed directly, without going through float, so the
+    result is exact. Raises ValueError for more than two decimal places.
+    """
+    match = _MONEY_PATTERN.fullmatch(value.strip())
+    if match is None:
+        raise ValueError(f"Invalid money amount: {value!r}")
+    sign, whole, frac = match.groups()
+    cents = int(whole or "0") * 100 + int((frac or "").ljust(2, "0"))
+    return -cents if sign == "-" else cents
+
+
+def cents_to_dollars(cents: int) -> float:
+    """Convert integer cents to dollars for output."""
+    return cents / 100
+
+
 def load_sales_from_csv(path: str) -> List[SaleRecord]:
     """
     Load sales records from a CSV file.
@@ -63,9 +105,9 @@ def load_sales_from_csv(path: str) -> List[SaleRecord]:
                 item=row["item"],
                 category=row["category"],
                 quantity=int(row["quantity"]),
-                unit_price=float(row["unit_price"]),
+                unit_price_cents=parse_cents(row["unit_price"]),
                 payment_method=row["payment_method"],
-                order_total=float(row["order_total"]),
+                order_total_cents=parse_cents(row["order_total"]),
             )
             records.append(record)
     return records
@@ -74,25 +116,30 @@ def load_sales_from_csv(path: str) -> List[SaleRecord]:
 # --- Analysis functions ---
 
 
+def _to_dollars(totals: Dict[str, int]) -> Dict[str, float]:
+    """Convert a mapping of cent totals to dollars."""
+    return {key: cents_to_dollars(cents) for key, cents in totals.items()}
+
+
 def total_revenue(records: Iterable[SaleRecord]) -> float:
     """Compute total revenue across all records."""
-    return sum(map(lambda r: r.line_revenue, records))
+    return cents_to_dollars(sum(map(lambda r: r.line_revenue_cents, records)))
 
 
 def revenue_by_city(records: Iterable[SaleRecord]) -> Dict[str, float]:
     """Compute total revenue grouped by store city."""
-    totals: Dict[str, float] = defaultdict(float)
+    totals: Dict[str, int] = defaultdict(int)
     for r in records:
-        totals[r.store_city] += r.line_revenue
-    return dict(totals)
+        totals[r.store_city] += r.line_revenue_cents
+    return _to_dollars(totals)
 
 
 def revenue_by_category(records: Iterable[SaleRecord]) -> Dict[str, float]:
     """Compute total revenue grouped by category."""
-    totals: Dict[str, float] = defaultdict(float)
+    totals: Dict[str, int] = defaultdict(int)
     for r in records:
-        totals[r.category] += r.line_revenue
-    return dict(totals)
+        totals[r.category] += r.line_revenue_cents
+    return _to_dollars(totals)
 
 
 def total_quantity_by_item(records: Iterable[SaleRecord]) -> Dict[str, int]:
@@ -112,20 +159,20 @@ def top_n_items_by_revenue(
     Returns:
         List of (item, revenue) sorted descending by revenue.
     """
-    totals: Dict[str, float] = defaultdict(float)
+    totals: Dict[str, int] = defaultdict(int)
     for r in records:
-        totals[r.item] += r.line_revenue
+        totals[r.item] += r.line_revenue_cents
 
     sorted_items = sorted(totals.items(), key=lambda kv: kv[1], reverse=True)
-    return sorted_items[:n]
+    return [(item, cents_to_dollars(cents)) for item, cents in sorted_items[:n]]
 
 
 def revenue_by_payment_method(records: Iterable[SaleRecord]) -> Dict[str, float]:
     """Compute total revenue grouped by payment method."""
-    totals: Dict[str, float] = defaultdict(float)
+    totals: Dict[str, int] = defaultdict(int)
     for r in records:
-        totals[r.payment_method] += r.line_revenue
-    return dict(totals)
+        totals[r.payment_method] += r.line_revenue_cents
+    return _to_dollars(totals)
 
 
 def average_order_total(records: Iterable[SaleRecord]) -> float:
@@ -134,13 +181,13 @@ def average_order_total(records: Iterable[SaleRecord]) -> float:
 
     Uses order_total aggregated per order_id to support multi-line orders.
     """
-    totals_by_order: Dict[str, float] = defaultdict(float)
+    totals_by_order: Dict[str, int] = defaultdict(int)
     for r in records:
         # If order_total is repeated per line, this keeps the last one
-        totals_by_order[r.order_id] = r.order_total
+        totals_by_order[r.order_id] = r.order_total_cents
 
     if not totals_by_order:
         return 0.0
 
-    total_revenue_all = sum(totals_by_order.values())
-    return total_revenue_all / len(totals_by_order)
+    total_cents_all = sum(totals_by_order.values())
+    return total_cents_all / (100 * len(totals_by_order))
@@ -1,7 +1,10 @@
+import os
+import tempfile
 import unittest
 from datetime import datetime
 
 from sales_analysis import (SaleRecord, average_order_total,
+                            load_sales_from_csv, parse_cents,
                             revenue_by_category, revenue_by_city,
                             revenue_by_payment_method, top_n_items_by_revenue,
                             total_quantity_by_item, total_revenue)
@@ -18,9 +21,9 @@ class TestSalesAnalysis(unittest.TestCase):
                 item="A",
                 category="sandwich",
                 quantity=2,
-                unit_price=3.00,
+                unit_price_cents=300,
                 payment_method="card",
-                order_total=6.00,
+                order_total_cents=600,
             ),
             SaleRecord(
                 order_id="2",
@@ -30,9 +33,9 @@ class TestSalesAnalysis(unittest.TestCase):
                 item="B",
                 category="sandwich",
                 quantity=1,
-                unit_price=2.00,
+                unit_price_cents=200,
                 payment_method="cash",
-                order_total=2.00,
+                order_total_cents=200,
             ),
             SaleRecord(
                 order_id="3",
@@ -42,9 +45,9 @@ class TestSalesAnalysis(unittest.TestCase):
                 item="C",
                 category="sides",
                 quantity=3,
-                unit_price=3.00,
+                unit_price_cents=300,
                 payment_method="card",
-                order_total=9.00,
+                order_total_cents=900,
             ),
         ]
 
@@ -108,6 +111,71 @@ class TestSalesAnalysis(unittest.TestCase):
         expected = sum(r.order_total for r in self.records) / len(self.records)
         self.assertAlmostEqual(average_order_total(self.records), expected, places=7)
 
+    def test_parse_cents(self) -> None:
+        self.assertEqual(parse_cents("12.00"), 1200)
+        self.assertEqual(parse_cents("9"), 900)
+        self.assertEqual(parse_cents("0.5"), 50)
+        self.assertEqual(parse_cents(" 3.07 "), 307)
+        self.assertEqual(parse_cents("-1.25"), -125)
+
+    def test_parse_cents_invalid(self) -> None:
+        for value in [
+            "",
+            ".",
+            "1.234",
+            "abc",
+            "1.2.3",
+            "-",
+            "--5",
+            "+-5",
+            "-+1.00",
+            "\uff11\uff12",
+            "\u0663.\u0660\u0660",
+        ]:
+            with self.assertRaises(ValueError):
+                parse_cents(value)
+
+    def test_total_revenue_is_exact(self) -> None:
+        # 0.10 summed in floats drifts; integer cents stays exact
+        records = [
+            SaleRecord(
+                order_id=str(i),
+                order_datetime=datetime(2025, 11, 20, 12, 0),
+                store_id="LA-01",
+                store_city="Los Angeles",
+                item="Lemonade",
+                category="drinks",
+                quantity=1,
+                unit_price_cents=10,
+                payment_method="card",
+                order_total_cents=10,
+            )
+            for i in range(3)
+        ]
+        self.assertEqual(total_revenue(records), 0.30)
+        self.assertEqual(revenue_by_city(records), {"Los Angeles": 0.30})
+
+    def test_load_sales_from_csv_parses_cents(self) -> None:
+        header = (
+            "order_id,order_datetime,store_id,store_city,item,category,"
+            "quantity,unit_price,payment_method,order_total\n"
+        )
+        rows = [
+            "1,2025-11-20 12:00,LA-01,Los Angeles,Lemonade,drinks,3,0.10,card,0.30\n",
+            "2,2025-11-20 12:01,LA-01,Los Angeles,Fries,sides,1,12.5,cash,12.5\n",
+        ]
+        with tempfile.NamedTemporaryFile(
+            "w", suffix=".csv", delete=False, encoding="utf-8", newline=""
+        ) as f:
+            f.write(header + "".join(rows))
+        self.addCleanup(os.remove, f.name)
+
+        records = load_sales_from_csv(f.name)
+
+        self.assertEqual([r.unit_price_cents for r in records], [10, 1250])
+        self.assertEqual([r.order_total_cents for r in records], [30, 1250])
+        self.assertEqual(total_revenue(records), 12.80)
+
 
 if __name__ == "__main__":
     unittest.main()